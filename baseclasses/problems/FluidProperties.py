@@ -107,10 +107,13 @@ class FluidProperties:
         """
 
         # calculate the dynamic viscosity
+        # Convert the temperature without modifying it in place, since it may be an array owned by the caller
         if self.englishUnits:
-            T /= 1.8
+            T = T / 1.8
 
-        self.mu = self.muSuthDim * (T / self.TSuthDim) ** 1.5 * (self.TSuthDim + self.SSuthDim) / (T + self.SSuthDim)
+        mu = self.muSuthDim * (T / self.TSuthDim) ** 1.5 * (self.TSuthDim + self.SSuthDim) / (T + self.SSuthDim)
 
         if self.englishUnits:
-            self.mu /= 47.9
+            mu /= 47.9
+
+        self.mu = mu
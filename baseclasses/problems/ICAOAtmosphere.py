@@ -1,5 +1,168 @@
+import cmath
+from functools import lru_cache
+import math
 import numpy as np
 
+# The set of break-points in the altitude (in km)
+_H_BREAK = np.array([11, 20, 32, 47, 51, 71, 84.852])
+# Midpoints between consecutive break-points, used to find the break-point nearest to an altitude
+_H_BREAK_MID = 0.5 * (_H_BREAK[:-1] + _H_BREAK[1:])
+
+# Properties at the base of each layer between the break-points: geopotential altitude (in km),
+# temperature (in K), temperature lapse rate (in K/km) and pressure ratio to sea level
+_LAYERS = (
+    (0.0, 288.15, -6.5, 1.0),
+    (11.0, 216.65, 0.0, 0.22336),
+    (20.0, 216.65, 1.0, 0.054032),
+    (32.0, 228.65, 2.8, 0.0085666),
+    (47.0, 270.65, 0.0, 0.0010945),
+    (51.0, 270.65, -2.8, 0.00066063),
+    (71.0, 214.65, -2.0, 0.000039046),
+)
+# The same table as arrays, one row per property, for evaluating many altitudes at once
+_LAYER_ARRAYS = np.array(_LAYERS).T
+
+
+# Hydrostatic constant g0 / R (in K/km)
+_K = 34.163195
+# Radius of Earth (in km)
+_R0 = 6356.766
+# Sea level pressure (in Pa)
+_P0 = 101325
+
+# Smoothing region on either side of the break-points (in km). 0.1 is 100m, seems to work
+# well. Please don't change.
+_DH_SMOOTH = 0.1
+# FD step used to compute the slopes at the edges of the smoothing regions (in km)
+_DH_FD = 1.0e-4  # confirmed with stepsize study do not change from 1e-4
+
+
+def _exp(x):
+    """Exponential of a scalar, using the math modules which are much cheaper than numpy for single values"""
+    if isinstance(x, float):
+        return math.exp(x)
+    if isinstance(x, complex):
+        return cmath.exp(x)
+    return np.exp(x)
+
+
+def _hermite(t, p0, m0, p1, m1):
+    """Compute a standard cubic hermite interpolant"""
+    return (
+        p0 * (2 * t**3 - 3 * t**2 + 1)
+        + m0 * (t**3 - 2 * t**2 + t)
+        + p1 * (-2 * t**3 + 3 * t**2)
+        + m1 * (t**3 - t**2)
+    )
+
+
+def _getTP(H, index):
+    """Compute temperature and pressure ratio at geopotential altitude H in the layer given by index"""
+    # Altitudes above the last break-point are extrapolated from the last layer
+    if isinstance(index, np.ndarray):
+        Hb, Tb, L, PPb = _LAYER_ARRAYS[:, np.minimum(index, len(_LAYERS) - 1)]
+        T = Tb + L * (H - Hb)
+        # The pressure follows a power law in layers with a lapse rate and decays exponentially in
+        # isothermal layers. Substitute a dummy lapse rate in the latter to avoid dividing by zero.
+        isothermal = L == 0.0
+        L = np.where(isothermal, 1.0, L)
+        PP = PPb * np.where(isothermal, np.exp(-_K * (H - Hb) / Tb), (Tb / T) ** (_K / L))
+    else:
+        Hb, Tb, L, PPb = _LAYERS[min(index, len(_LAYERS) - 1)]
+        if L == 0.0:
+            T = Tb
+            PP = PPb * _exp(-_K * (H - Hb) / Tb)
+        else:
+            T = Tb + L * (H - Hb)
+            PP = PPb * (Tb / T) ** (_K / L)
+
+    return T, PP
+
+
+def _computeAtmosphere(altitude, englishUnits):
+    """
+    Compute the atmospheric pressure and temperature at altitude, 'altitude' in meters,
+    or in feet if 'englishUnits' is True. The altitude may be a scalar or an array.
+    """
+    isScalar = np.ndim(altitude) == 0
+    # Convert altitude to km since this is what the ICAO
+    # atmosphere uses:
+    if englishUnits:
+        altitude = altitude * 0.3048 / 1000.0
+    else:
+        altitude = altitude / 1000.0
+
+    H = altitude / (1.0 + altitude / _R0)
+
+    # Get the nominal values we need
+    index = _H_BREAK.searchsorted(np.real(H), side="left")
+    T, PP = _getTP(H, index)
+
+    # Determine if we need to do smoothing or not. The break-points are much further apart than
+    # the smoothing regions, so only the nearest break-point needs to be checked.
+    index = _H_BREAK_MID.searchsorted(np.real(H))
+    H0 = _H_BREAK[index]
+    smooth = abs(np.real(H) - H0) < _DH_SMOOTH
+
+    if smooth.any():
+        H_smooth = H
+        if not isScalar:
+            # Only interpolate the altitudes that are within a smoothing region
+            H_smooth = H[smooth]
+            index = index[smooth]
+            H0 = H0[smooth]
+
+        # Parametric distance along smoothing region
+        H_left = H0 - _DH_SMOOTH
+        H_right = H0 + _DH_SMOOTH
+
+        t = (H_smooth - H_left) / (H_right - H_left)  # Parametric value from 0 to 1
+
+        # Compute slope and values at the left boundary
+        TL, PPL = _getTP(H_left, index)
+        Tph, PPph = _getTP(H_left + _DH_FD, index)
+        Tmh, PPmh = _getTP(H_left - _DH_FD, index)
+
+        T_left = TL
+        PP_left = PPL
+
+        T_slope_left = (Tph - Tmh) / (2 * _DH_FD) * (_DH_SMOOTH * 2)
+        PP_slope_left = (PPph - PPmh) / (2 * _DH_FD) * (_DH_SMOOTH * 2)
+
+        # Compute slope and values at the right boundary
+        TR, PPR = _getTP(H_right, index + 1)
+        Tph, PPph = _getTP(H_right + _DH_FD, index + 1)
+        Tmh, PPmh = _getTP(H_right - _DH_FD, index + 1)
+
+        T_right = TR
+        PP_right = PPR
+
+        T_slope_right = (Tph - Tmh) / (2 * _DH_FD) * (_DH_SMOOTH * 2)
+        PP_slope_right = (PPph - PPmh) / (2 * _DH_FD) * (_DH_SMOOTH * 2)
+
+        # Standard cubic hermite spline interpolation
+        T_smooth = _hermite(t, T_left, T_slope_left, T_right, T_slope_right)
+        PP_smooth = _hermite(t, PP_left, PP_slope_left, PP_right, PP_slope_right)
+        if isScalar:
+            T, PP = T_smooth, PP_smooth
+        else:
+            T[smooth] = T_smooth
+            PP[smooth] = PP_smooth
+    # end if
+
+    P = _P0 * PP  # Pressure
+
+    if englishUnits:
+        P = P / 47.88020833333
+        T = T * 1.8
+
+    return P, T
+
+
+# The same scalar altitude is often evaluated repeatedly, for example when the other design variables of an
+# AeroProblem are perturbed, so scalar results are cached. Complex altitudes are cached separately from real ones.
+_computeScalarAtmosphere = lru_cache(maxsize=128, typed=True)(_computeAtmosphere)
+
 
 class ICAOAtmosphere:
     def __init__(self, **kwargs):
@@ -10,124 +173,14 @@ class ICAOAtmosphere:
 
     def __call__(self, altitude):
         """
-        Compute the atmospheric properties at altitude, 'altitude' in meters
+        Compute the atmospheric properties at altitude, 'altitude' in meters.
+        The altitude may also be an array, in which case arrays of the same shape are returned.
         """
         if altitude is None:
             return None, None
-        # Convert altitude to km since this is what the ICAO
-        # atmosphere uses:
-        if self.englishUnits:
-            altitude = altitude * 0.3048 / 1000.0
-        else:
-            altitude = altitude / 1000.0
-
-        K = 34.163195
-        R0 = 6356.766  # Radius of Earth
-        H = altitude / (1.0 + altitude / R0)
-
-        # Smoothing region on either side. 0.1 is 100m, seems to work
-        # well. Please don't change.
-        dH_smooth = 0.1
-
-        # Sea Level Values
-        P0 = 101325  # Pressure
-
-        # The set of break-points in the altitude (in km)
-        H_break = np.array([11, 20, 32, 47, 51, 71, 84.852])
-
-        def hermite(t, p0, m0, p1, m1):
-            """Compute a standard cubic hermite interpolant"""
-            return (
-                p0 * (2 * t**3 - 3 * t**2 + 1)
-                + m0 * (t**3 - 2 * t**2 + t)
-                + p1 * (-2 * t**3 + 3 * t**2)
-                + m1 * (t**3 - t**2)
-            )
-
-        def getTP(H, index):
-            """Compute temperature and pressure"""
-            if index == 0:
-                T = 288.15 - 6.5 * H
-                PP = (288.15 / T) ** (-K / 6.5)
-            elif index == 1:
-                T = 216.65
-                PP = 0.22336 * np.exp(-K * (H - 11) / 216.65)
-            elif index == 2:
-                T = 216.65 + (H - 20)
-                PP = 0.054032 * (216.65 / T) ** K
-            elif index == 3:
-                T = 228.65 + 2.8 * (H - 32)
-                PP = 0.0085666 * (228.65 / T) ** (K / 2.8)
-            elif index == 4:
-                T = 270.65
-                PP = 0.0010945 * np.exp(-K * (H - 47) / 270.65)
-            elif index == 5:
-                T = 270.65 - 2.8 * (H - 51)
-                PP = 0.00066063 * (270.65 / T) ** (-K / 2.8)
-            elif index == 6:
-                T = 214.65 - 2 * (H - 71)
-                PP = 0.000039046 * (214.65 / T) ** (-K / 2)
-
-            return T, PP
-
-        # Determine if we need to do smoothing or not:
-        smooth = False
-        for index in range(len(H_break)):
-            if np.real(H) > H_break[index] - dH_smooth and np.real(H) < H_break[index] + dH_smooth:
-                smooth = True
-                break
-
-        if not smooth:
-            index = H_break.searchsorted(H, side="left")
-
-            # Get the nominal values we need
-            T, PP = getTP(H, index)
-        else:
-            H0 = H_break[index]
-            # Parametric distance along smoothing region
-            H_left = H0 - dH_smooth
-            H_right = H0 + dH_smooth
-
-            t = (H - H_left) / (H_right - H_left)  # Parametric value from 0 to 1
-
-            # set an FD step to compute the derivs
-
-            dh_FD = 1.0e-4  # confirmed with stepsize study do not change from 1e-4
-
-            # Compute slope and values at the left boundary
-            TL, PPL = getTP(H_left, index)
-            Tph, PPph = getTP(H_left + dh_FD, index)
-            Tmh, PPmh = getTP(H_left - dh_FD, index)
-
-            T_left = TL
-            PP_left = PPL
-
-            T_slope_left = (Tph - Tmh) / (2 * dh_FD) * (dH_smooth * 2)
-            PP_slope_left = (PPph - PPmh) / (2 * dh_FD) * (dH_smooth * 2)
-
-            # Compute slope and values at the right boundary
-            TR, PPR = getTP(H_right, index + 1)
-            Tph, PPph = getTP(H_right + dh_FD, index + 1)
-            Tmh, PPmh = getTP(H_right - dh_FD, index + 1)
-
-            T_right = TR
-            PP_right = PPR
-
-            T_slope_right = (Tph - Tmh) / (2 * dh_FD) * (dH_smooth * 2)
-            PP_slope_right = (PPph - PPmh) / (2 * dh_FD) * (dH_smooth * 2)
-
-            # Standard cubic hermite spline interpolation
-            T = hermite(t, T_left, T_slope_left, T_right, T_slope_right)
-            PP = hermite(t, PP_left, PP_slope_left, PP_right, PP_slope_right)
-        # end if
-
-        P = P0 * PP  # Pressure
-
-        if self.englishUnits:
-            P /= 47.88020833333
-            T *= 1.8
-
-        return P, T
+        if isinstance(altitude, (np.ndarray, list, tuple)):
+            return _computeAtmosphere(np.asarray(altitude), self.englishUnits)
+        return _computeScalarAtmosphere(altitude, self.englishUnits)
 
 
 # ==============================================================================
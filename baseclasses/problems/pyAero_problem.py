@@ -5,6 +5,8 @@ pyAero_problem
 # =============================================================================
 # Imports
 # =============================================================================
+import cmath
+import math
 import numpy as np
 import warnings
 from .ICAOAtmosphere import ICAOAtmosphere
@@ -12,6 +14,18 @@ from .FluidProperties import FluidProperties
 from ..utils import CaseInsensitiveDict, Error, SolverHistory
 
 
+def _sqrt(x):
+    """
+    Square root of a flow state. Scalars use the math modules, which are much cheaper than
+    numpy for single values, with cmath keeping complex-step perturbations intact.
+    """
+    if isinstance(x, float) and x >= 0.0:
+        return math.sqrt(x)
+    if isinstance(x, complex):
+        return cmath.sqrt(x)
+    return np.sqrt(x)
+
+
 class AeroProblem(FluidProperties):
     """
     The main purpose of this class is to represent all relevant
@@ -645,21 +659,29 @@ R=100, muSuthDim=1.22e-3, TSuthDim=288.15)
             design variable names this object needs
         """
 
+        # The flow states are coupled, so collect them and update the flow state once
+        # all of them are known instead of recomputing it for each one
+        stateUpdates = {}
         for dvName in self.DVs:
             if dvName in x:
                 key = self.DVs[dvName].key
                 family = self.DVs[dvName].family
                 value = x[dvName] + self.DVs[dvName].offset
-                if family is None:
-                    setattr(self, key, value)
-                else:
+                if family is not None:
                     self.bcVarData[key, family] = value
+                elif key in self.fullState:
+                    stateUpdates[key] = value
+                else:
+                    setattr(self, key, value)
 
                 try:  # To set in the DV as well if the DV exists:
                     self.DVs[dvName].value = x[dvName]
                 except:  # noqa
                     pass  # DV doesn't exist
 
+        if stateUpdates:
+            self._setStates(stateUpdates)
+
     def getDesignVars(self):
         """Get the current DV values.
 
@@ -780,20 +802,19 @@ R=100, muSuthDim=1.22e-3, TSuthDim=288.15)
             The functions that the user wants evaluated
         """
 
-        # Make sure all the functions have been evaluated.
-        tmp = {}
-        self.evalFunctions(tmp, evalFuncs)
-
-        # Check that all functions are ok:
+        # Check that all functions are ok. The function values themselves are not needed here,
+        # so rather than calling evalFunctions we only register their names in funcNames.
+        # Invalid functions always raise, regardless of ignoreMissing, as they did when evalFunctions was called.
         if set(evalFuncs) <= self.possibleFunctions:
             for f in evalFuncs:
-                funcsSens[self.funcNames[f]] = self._getDVSens(f)
+                key = self.name + "_%s" % f
+                self.funcNames[f] = key
+                funcsSens[key] = self._getDVSens(f)
         else:
-            if not ignoreMissing:
-                raise Error(
-                    "One of the functions in 'evalFunctionsSens' was "
-                    "not valid. The valid list of functions is: %s." % (repr(self.possibleFunctions))
-                )
+            raise Error(
+                "One of the functions in 'evalFunctionsSens' was "
+                "not valid. The valid list of functions is: %s." % (repr(self.possibleFunctions))
+            )
 
     def _set_aeroDV_val(self, key, value):
         # Find the DV matching this value. This is inefficient, but
@@ -931,7 +952,7 @@ R=100, muSuthDim=1.22e-3, TSuthDim=288.15)
 
         """
         # Calculate the speed of sound
-        self.a = np.sqrt(self.gamma * self.R * self.T)
+        self.a = _sqrt(self.gamma * self.R * self.T)
 
         # Update the dynamic viscosity based on T using Sutherland's law
         self.updateViscosity(self.T)
@@ -967,7 +988,7 @@ R=100, muSuthDim=1.22e-3, TSuthDim=288.15)
 
         """
         # Calculate the speed of sound
-        self.a = np.sqrt(self.gamma * self.R * self.T)
+        self.a = _sqrt(self.gamma * self.R * self.T)
 
         # Update the dynamic viscosity based on T using Sutherland's law
         self.updateViscosity(self.T)
@@ -997,7 +1018,7 @@ R=100, muSuthDim=1.22e-3, TSuthDim=288.15)
 
         """
         # Calculate the speed of sound
-        self.a = np.sqrt(self.gamma * self.R * self.T)
+        self.a = _sqrt(self.gamma * self.R * self.T)
 
         # Update the dynamic viscosity based on T using Sutherland's law
         self.updateViscosity(self.T)
@@ -1026,9 +1047,16 @@ R=100, muSuthDim=1.22e-3, TSuthDim=288.15)
             key = self.DVs[dvName].key
             family = self.DVs[dvName].family
             if family is None:
-                setattr(self, key, getattr(self, key) + h)
-                rDict[dvName] = np.imag(self.__dict__[func]) / hr
-                setattr(self, key, np.real(getattr(self, key)))
+                if key in self.fullState and func in self.fullState:
+                    # The flow states are coupled, so use the complex step. Go through _setStates
+                    # directly so that the perturbation does not touch the DV values.
+                    value = self.__dict__[key]
+                    self._setStates({key: value + h})
+                    rDict[dvName] = np.imag(self.__dict__[func]) / hr
+                    self._setStates({key: value})
+                else:
+                    # Otherwise the function is either the design variable itself or independent of it
+                    rDict[dvName] = 1.0 if key == func else 0.0
 
         return rDict
 
@@ -12,6 +12,7 @@ try:
 except ImportError:
     geo_utils = None
 from ..utils import Error
+from ..utils.fileIO import TECPLOT_BLOCK_SIZE
 
 
 class WeightProblem:
@@ -194,24 +195,30 @@ class WeightProblem:
             File name for tecplot file. Should have a .dat extension.
 
         """
-        f = open(fileName, "w")
-        f.write('TITLE = "weight_problem Surface Mesh"\n')
-        f.write('VARIABLES = "CoordinateX" "CoordinateY" "CoordinateZ"\n')
-        f.write("Zone T=%s\n" % ("surf"))
-        f.write("Nodes = %d, Elements = %d ZONETYPE=FETRIANGLE\n" % (len(self.p0) * 3, len(self.p0)))
-        f.write("DATAPACKING=POINT\n")
-        for i in range(len(self.p0)):
-            points = []
-            points.append(self.p0[i])
-            points.append(self.p0[i] + self.v1[i])
-            points.append(self.p0[i] + self.v2[i])
-            for i in range(len(points)):
-                f.write(f"{points[i][0]:f} {points[i][1]:f} {points[i][2]:f}\n")
-
-        for i in range(len(self.p0)):
-            f.write("%d %d %d\n" % (3 * i + 1, 3 * i + 2, 3 * i + 3))
-
-        f.close()
+        nTri = len(self.p0)
+        header = [
+            'TITLE = "weight_problem Surface Mesh"\n',
+            'VARIABLES = "CoordinateX" "CoordinateY" "CoordinateZ"\n',
+            "Zone T=%s\n" % ("surf"),
+            "Nodes = %d, Elements = %d ZONETYPE=FETRIANGLE\n" % (nTri * 3, nTri),
+            "DATAPACKING=POINT\n",
+        ]
+        with open(fileName, "w") as f:
+            f.write("".join(header))
+            # Fill the nodes of every triangle directly into a single point-packed buffer
+            points = np.empty((3 * nTri, 3), dtype=np.result_type(self.p0, self.v1, self.v2))
+            points[0::3] = self.p0
+            points[1::3] = self.p0 + self.v1
+            points[2::3] = self.p0 + self.v2
+            # Format and write the nodes in blocks of rows to bound the memory used by the text
+            for i in range(0, 3 * nTri, TECPLOT_BLOCK_SIZE):
+                block = points[i : i + TECPLOT_BLOCK_SIZE].tolist()
+                f.write("".join(f"{x:f} {y:f} {z:f}\n" for x, y, z in block))
+
+            # Nodes are numbered consecutively, so each block of the connectivity is formatted in a single pass
+            for i in range(0, nTri, TECPLOT_BLOCK_SIZE):
+                nBlock = min(TECPLOT_BLOCK_SIZE, nTri - i)
+                f.write(("%d %d %d\n" * nBlock) % tuple(range(3 * i + 1, 3 * (i + nBlock) + 1)))
 
     def writeTecplot(self, fileName):
         """
@@ -226,15 +233,14 @@ class WeightProblem:
             File name for tecplot file. Should have a .dat extension.
         """
 
-        f = open(fileName, "w")
-        f.write('TITLE = "Weight_problem Data"\n')
-        f.write('VARIABLES = "CoordinateX" "CoordinateY" "CoordinateZ"\n')
+        with open(fileName, "w") as f:
+            f.write('TITLE = "Weight_problem Data"\n')
+            f.write('VARIABLES = "CoordinateX" "CoordinateY" "CoordinateZ"\n')
 
-        for compKey in self.components.keys():
-            comp = self.components[compKey]
-            if comp.hasCoords:
-                comp.writeTecplot(f)
-        f.close()
+            for compKey in self.components.keys():
+                comp = self.components[compKey]
+                if comp.hasCoords:
+                    comp.writeTecplot(f)
 
     def setDVGeo(self, DVGeo):
         """
@@ -494,28 +500,28 @@ class WeightProblem:
         """
 
         fileHandle = filename + ".dat"
-        f = open(fileHandle, "w")
         nMasses = len(self.nameList)
-        f.write('TITLE = "%s: Mass Data"\n' % self.name)
-        f.write('VARIABLES = "X", "Y", "Z", "Mass"\n')
         locList = ["current", "fwd", "aft"]
+        with open(fileHandle, "w") as f:
+            f.write('TITLE = "%s: Mass Data"\n' % self.name)
+            f.write('VARIABLES = "X", "Y", "Z", "Mass"\n')
 
-        for loc in locList:
-            f.write('ZONE T="%s", I=%d, J=1, K=1, DATAPACKING=POINT\n' % (loc, nMasses))
+            for loc in locList:
+                f.write('ZONE T="%s", I=%d, J=1, K=1, DATAPACKING=POINT\n' % (loc, nMasses))
 
-            for key in self.components.keys():
-                CG = self.components[key].getCG(loc)
-                mass = self.components[key].getMass()
-                x = np.real(CG[0])
-                y = np.real(CG[1])
-                z = np.real(CG[2])
-                m = np.real(mass)
+                for key in self.components.keys():
+                    CG = self.components[key].getCG(loc)
+                    mass = self.components[key].getMass()
+                    x = np.real(CG[0])
+                    y = np.real(CG[1])
+                    z = np.real(CG[2])
+                    m = np.real(mass)
 
-                f.write(f"{x:f} {y:f} {z:f} {m:f}\n")
+                    f.write(f"{x:f} {y:f} {z:f} {m:f}\n")
 
+                # end
+                f.write("\n")
             # end
-            f.write("\n")
-        # end
 
         # textOffset = 0.5
         # for loc in locList:
@@ -530,7 +536,6 @@ class WeightProblem:
 
         # # end
 
-        f.close()
         return
 
     def writeProblemData(self, fileName):
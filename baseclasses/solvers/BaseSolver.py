@@ -167,14 +167,18 @@ class BaseSolver:
            Return the current value of the option.
         """
 
+        # All default options are set on initialization, so a single lookup
+        # suffices in the common case and validation only happens on a miss
+        try:
+            return self.options[name]
+        except KeyError:
+            pass
+
         if name in self.defaultOptions or not self.checkDefaultOptions:
-            if name in self.options:
-                return self.options[name]
-            else:
-                raise Error(
-                    f"Option {name} was not found. "
-                    + "Because options checking has been disabled, make sure the option has been set first."
-                )
+            raise Error(
+                f"Option {name} was not found. "
+                + "Because options checking has been disabled, make sure the option has been set first."
+            )
         else:
             guess = get_close_matches(name, list(self.defaultOptions.keys()), n=1, cutoff=0.0)[0]
             raise Error(f"{name} is not a valid option name. Perhaps you meant {guess}?")
@@ -14,6 +14,7 @@ import numpy as np
 # =============================================================================
 from .BaseSolver import BaseSolver
 from ..utils import CaseInsensitiveDict, Error
+from ..utils.fileIO import TECPLOT_BLOCK_SIZE
 
 # =============================================================================
 # AeroSolver Class
@@ -207,24 +208,33 @@ class AeroSolver(BaseSolver):
         """
         [p0, v1, v2] = self.getTriangulatedMeshSurface(groupName, **kwargs)
         if self.comm.rank == 0:
-            f = open(fileName, "w")
-            f.write('TITLE = "%s Surface Mesh"\n' % self.name)
-            f.write('VARIABLES = "CoordinateX" "CoordinateY" "CoordinateZ"\n')
-            f.write("Zone T=%s\n" % ("surf"))
-            f.write("Nodes = %d, Elements = %d ZONETYPE=FETRIANGLE\n" % (len(p0) * 3, len(p0)))
-            f.write("DATAPACKING=POINT\n")
-            for i in range(len(p0)):
-                points = []
-                points.append(p0[i])
-                points.append(p0[i] + v1[i])
-                points.append(p0[i] + v2[i])
-                for i in range(len(points)):
-                    f.write(f"{points[i][0]:f} {points[i][1]:f} {points[i][2]:f}\n")
-
-            for i in range(len(p0)):
-                f.write("%d %d %d\n" % (3 * i + 1, 3 * i + 2, 3 * i + 3))
-
-            f.close()
+            p0 = np.asarray(p0).reshape(-1, 3)
+            v1 = np.asarray(v1).reshape(-1, 3)
+            v2 = np.asarray(v2).reshape(-1, 3)
+            nTri = len(p0)
+            header = [
+                'TITLE = "%s Surface Mesh"\n' % self.name,
+                'VARIABLES = "CoordinateX" "CoordinateY" "CoordinateZ"\n',
+                "Zone T=%s\n" % ("surf"),
+                "Nodes = %d, Elements = %d ZONETYPE=FETRIANGLE\n" % (nTri * 3, nTri),
+                "DATAPACKING=POINT\n",
+            ]
+            with open(fileName, "w") as f:
+                f.write("".join(header))
+                # Fill the nodes of every triangle directly into a single point-packed buffer
+                points = np.empty((3 * nTri, 3), dtype=np.result_type(p0, v1, v2))
+                points[0::3] = p0
+                points[1::3] = p0 + v1
+                points[2::3] = p0 + v2
+                # Format and write the nodes in blocks of rows to bound the memory used by the text
+                for i in range(0, 3 * nTri, TECPLOT_BLOCK_SIZE):
+                    block = points[i : i + TECPLOT_BLOCK_SIZE].tolist()
+                    f.write("".join(f"{x:f} {y:f} {z:f}\n" for x, y, z in block))
+
+                # Nodes are numbered consecutively, so each block of the connectivity is formatted in a single pass
+                for i in range(0, nTri, TECPLOT_BLOCK_SIZE):
+                    nBlock = min(TECPLOT_BLOCK_SIZE, nTri - i)
+                    f.write(("%d %d %d\n" * nBlock) % tuple(range(3 * i + 1, 3 * (i + nBlock) + 1)))
 
     def checkSolutionFailure(self, aeroProblem, funcs):
         """Take in a an aeroProblem and check for failure. Then append the
@@ -9,7 +9,10 @@ import os
 import sys
 from contextlib import contextmanager
 from ..utils import Error
-from ..utils import writeJSON, readJSON
+from ..utils import writeJSON, readJSON, writePickle, readPickle
+
+# Types that BaseRegTest.assert_allclose compares without going through numpy.testing
+_scalarTypes = (int, float, complex, np.number)
 
 
 def getTol(**kwargs):
@@ -63,6 +66,8 @@ class BaseRegTest:
         ----------
         ref_file : str
             The name of the reference file, containing its full path.
+            Reference files are written as JSON, unless the name ends in ``.pkl``, in which case pickle is used.
+            Pickle files are not human-readable, but are much faster to read and write for large arrays.
         train : bool, optional
             Whether to train the reference values, or test against existing reference values, by default False
         comm : MPI communicator, optional
@@ -115,14 +120,20 @@ class BaseRegTest:
         if "metadata" in self.db:
             self.db["metadata"] = self.db.pop("metadata")
         with multi_proc_exception_check(self.comm):
-            writeJSON(self.ref_file, self.db, comm=self.comm)
+            if self.ref_file.endswith(".pkl"):
+                writePickle(self.ref_file, self.db, comm=self.comm)
+            else:
+                writeJSON(self.ref_file, self.db, comm=self.comm)
 
     def readRef(self):
         """
         Read in the reference file on the root proc, then broadcast to all procs
         """
         with multi_proc_exception_check(self.comm):
-            db = readJSON(self.ref_file, comm=self.comm)
+            if self.ref_file.endswith(".pkl"):
+                db = readPickle(self.ref_file, comm=self.comm)
+            else:
+                db = readJSON(self.ref_file, comm=self.comm)
             self.metadata = db.pop("metadata", None)
         return db
 
@@ -199,7 +210,7 @@ class BaseRegTest:
                 self._add_dict(name, d, name, **kwargs)
 
     # Add values from all processors
-    def par_add_val(self, name, values, **kwargs):
+    def par_add_val(self, name, values, use_buffer=False, **kwargs):
         """
         Add value(values) from parallel process in sorted order
 
@@ -209,12 +220,19 @@ class BaseRegTest:
             The name of the value
         values : ndarray
             The array to be added. This must be a numpy array distributed over self.comm
+        use_buffer : bool, optional
+            Whether to gather 1D numeric arrays as raw buffers instead of pickled objects, by default False.
+            This is faster for large arrays, but costs an extra collective to share the array sizes,
+            so it is slower for small ones. It must be the same on all procs.
         \*\*kwargs
             See :meth:`getTol <baseclasses.BaseRegTest.getTol>` on how to specif tolerances.
         """
         if self.comm is None:
             raise Error("Parallel functionality requires mpi4py!")
-        values = self.comm.gather(values)
+        if use_buffer:
+            values = self._gather_buffers(values)
+        else:
+            values = self.comm.gather(values)
         with multi_proc_exception_check(self.comm):
             if self.rank == 0:
                 self._add_values(name, values, **kwargs)
@@ -234,10 +252,10 @@ class BaseRegTest:
         """
         if self.comm is None:
             raise Error("Parallel functionality requires mpi4py!")
-        reducedSum = self.comm.reduce(np.sum(values))
+        reducedSum = self._reduce_sums([np.sum(values)])
         with multi_proc_exception_check(self.comm):
             if self.rank == 0:
-                self._add_values(name, reducedSum, **kwargs)
+                self._add_values(name, reducedSum[0], **kwargs)
 
     def par_add_norm(self, name, values, **kwargs):
         """
@@ -254,16 +272,117 @@ class BaseRegTest:
         """
         if self.comm is None:
             raise Error("Parallel functionality requires mpi4py!")
-        reducedSum = self.comm.reduce(np.sum(values**2))
+        # The dot product sums the squares in one pass without a temporary array.
+        # It does not conjugate, so this matches sum(values**2) for complex values as well.
+        values = np.ravel(values)
+        reducedSum = self._reduce_sums([np.dot(values, values)])
         with multi_proc_exception_check(self.comm):
             if self.rank == 0:
-                self._add_values(name, np.sqrt(reducedSum), **kwargs)
+                self._add_values(name, np.sqrt(reducedSum[0]), **kwargs)
+
+    def par_add_sum_and_norm(self, sum_name, norm_name, values, **kwargs):
+        r"""
+        Add both the sum and the norm across values from all processors.
+        This is equivalent to calling :meth:`par_add_sum` and :meth:`par_add_norm`,
+        but only requires a single reduction.
+
+        Parameters
+        ----------
+        sum_name : str
+            The name of the sum
+        norm_name : str
+            The name of the norm
+        values : ndarray
+            The array to be added. This must be a numpy array distributed over self.comm
+        \*\*kwargs
+            See :meth:`getTol <baseclasses.BaseRegTest.getTol>` on how to specify tolerances.
+        """
+        if self.comm is None:
+            raise Error("Parallel functionality requires mpi4py!")
+        values = np.ravel(values)
+        reducedSums = self._reduce_sums([np.sum(values), np.dot(values, values)])
+        with multi_proc_exception_check(self.comm):
+            if self.rank == 0:
+                self._add_values(sum_name, reducedSums[0], **kwargs)
+                self._add_values(norm_name, np.sqrt(reducedSums[1]), **kwargs)
 
     # *****************
     # Private functions
     # *****************
+    def _gather_buffers(self, values):
+        """
+        Gather the values from all procs on the root proc. The dtype and size of each 1D numeric array are shared
+        as integers first so that the arrays can be gathered as raw buffers. Anything else is gathered as pickled objects.
+
+        Parameters
+        ----------
+        values : ndarray
+            The local values
+
+        Returns
+        -------
+        list or None
+            The values from every proc on the root proc, and None otherwise
+        """
+        isBuffer = (
+            isinstance(values, np.ndarray)
+            and values.ndim == 1
+            and values.dtype.kind in "iufc"
+            and values.dtype.isnative
+        )
+        meta = np.array([values.dtype.num, values.size] if isBuffer else [-1, 0], dtype=np.int64)
+        allMeta = np.empty((self.comm.size, 2), dtype=np.int64)
+        self.comm.Allgather(meta, allMeta)
+        dtypeNums, counts = allMeta.T
+        if dtypeNums[0] < 0 or np.any(dtypeNums != dtypeNums[0]):
+            return self.comm.gather(values)
+        sendbuf = np.ascontiguousarray(values)
+        if self.rank == 0:
+            recvbuf = np.empty(counts.sum(), dtype=sendbuf.dtype)
+            self.comm.Gatherv(sendbuf, [recvbuf, counts], root=0)
+            return np.split(recvbuf, np.cumsum(counts)[:-1])
+        self.comm.Gatherv(sendbuf, None, root=0)
+        return None
+
+    def _reduce_sums(self, localSums):
+        """
+        Sum the local values over all procs with a buffer-based reduction, which avoids pickling.
+        The procs may hold values of different types, so every proc sends the real and imaginary parts
+        as float64 along with a flag marking complex values, and the root proc rebuilds the sums from these.
+
+        Parameters
+        ----------
+        localSums : list of scalars
+            The local values to be summed, this must have the same length on all procs
+
+        Returns
+        -------
+        ndarray or None
+            The sums, which are complex if the values are complex on any proc, on the root proc and None otherwise
+        """
+        localSums = np.asarray(localSums)
+        sendbuf = np.empty(2 * localSums.size + 1)
+        sendbuf[:-1] = localSums.astype(np.complex128).view(np.float64)
+        sendbuf[-1] = np.iscomplexobj(localSums)
+        recvbuf = np.empty_like(sendbuf) if self.rank == 0 else None
+        self.comm.Reduce(sendbuf, recvbuf, op=MPI.SUM, root=0)
+        if self.rank == 0:
+            reducedSums = recvbuf[:-1].view(np.complex128)
+            return reducedSums if recvbuf[-1] else reducedSums.real
+        return None
+
     def assert_allclose(self, actual, reference, name, rtol, atol, full_name=None):
         """This is basically a wrapper on numpy.testing.assert_allclose with a generated error message"""
+        # Scalars are checked inline with the same criterion as numpy, whose overhead dominates for single values.
+        # Anything that does not pass here (including NaNs) falls through to numpy for the usual error message.
+        if isinstance(actual, _scalarTypes) and isinstance(reference, _scalarTypes):
+            if abs(actual - reference) <= atol + rtol * abs(reference):
+                return
+        # Reference files store float64 values exactly, so arrays that were reproduced bit for bit
+        # can skip the tolerance check, which is much more expensive than a plain equality check
+        elif isinstance(actual, np.ndarray) and isinstance(reference, np.ndarray):
+            if np.array_equal(actual, reference):
+                return
         if full_name is None:
             full_name = name
         msg = f"Failed value for: {full_name}"
@@ -317,7 +436,7 @@ class BaseRegTest:
             db = self.db
         if not self.train or (self.train and compare):
             # if the values contain numeric data
-            if np.issubdtype(np.array(values).dtype, np.number):
+            if np.issubdtype(np.asarray(values).dtype, np.number):
                 self.assert_allclose(values, db[name], name, rtol, atol, full_name)
             # otherwise perform equality comparison
             else:
@@ -356,15 +475,18 @@ class BaseRegTest:
         elif dict_name not in db.keys():
             raise ValueError(f"The key '{dict_name}' was not found in the reference file!")
 
-        for key in sorted(d.keys()):
+        subDB = db[dict_name]
+        for key in sorted(d):
+            value = d[key]
             full_name = f"{full_name}: {key}"
-            if isinstance(d[key], bool):
-                self._add_values(key, int(d[key]), rtol=rtol, atol=atol, db=db[dict_name], full_name=full_name)
-            elif isinstance(d[key], dict):
+            if isinstance(value, bool):
+                self._add_values(key, int(value), rtol=rtol, atol=atol, db=subDB, full_name=full_name)
+            elif isinstance(value, dict):
                 # do some good ol' fashion recursion
-                self._add_dict(key, d[key], full_name, rtol=rtol, atol=atol, db=db[dict_name])
+                self._add_dict(key, value, full_name, rtol=rtol, atol=atol, db=subDB)
             else:
-                self._add_values(key, d[key], rtol=rtol, atol=atol, db=db[dict_name], full_name=full_name)
+                # arrays are compared in a single vectorized call within _add_values
+                self._add_values(key, value, rtol=rtol, atol=atol, db=subDB, full_name=full_name)
 
 
 # This strategy of dealing with error propagation to multiple procs is taken directly form openMDAO.utils;
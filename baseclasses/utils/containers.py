@@ -56,8 +56,9 @@ class CaseInsensitiveDict(MutableMapping):
         KeyError
             If ``raiseError`` and key is not found.
         """
-        if key.lower() in self.map:
-            return self.map[key.lower()]
+        lowerKey = key.lower()
+        if lowerKey in self.map:
+            return self.map[lowerKey]
         else:
             if raiseError:
                 raise KeyError(f"Key '{key}' not found.")
@@ -66,16 +67,24 @@ class CaseInsensitiveDict(MutableMapping):
     def __setitem__(self, key: str, value: Any):
         if not isinstance(key, str):
             raise TypeError("All keys must be strings.")
-        existingKey = self._getKey(key)
-        if existingKey:
-            key = existingKey
+        # Keep the original capitalization if the key already exists
+        key = self.map.setdefault(key.lower(), key)
         self.data[key] = value
-        self.map[key.lower()] = key
 
     def __getitem__(self, key: str) -> Any:
         existingKey = self._getKey(key, raiseError=True)
         return self.data[existingKey]
 
+    def __contains__(self, key: str) -> bool:
+        # Overridden since the MutableMapping implementation relies on catching the KeyError from __getitem__
+        return key.lower() in self.map
+
+    def get(self, key: str, default: Any = None) -> Any:
+        existingKey = self.map.get(key.lower())
+        if existingKey is None:
+            return default
+        return self.data[existingKey]
+
     def __delitem__(self, key: str):
         existingKey = self._getKey(key, raiseError=True)
         self.map.pop(existingKey.lower())
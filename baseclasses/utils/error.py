@@ -6,14 +6,21 @@ class Error(Exception):
 
     def __init__(self, message):
         self.message = message
-        msg = "\n+" + "-" * 78 + "+" + "\n" + "| Error: "
+        # Collect the words of each line and join them once at the end,
+        # rather than growing the message string one word at a time
+        lines = []
+        words = ["Error:"]
         i = 8
         for word in message.split():
             if len(word) + i + 1 > 78:  # Finish line and start new one
-                msg += " " * (78 - i) + "|\n| " + word + " "
+                lines.append(words)
+                words = [word]
                 i = 1 + len(word) + 1
             else:
-                msg += word + " "
+                words.append(word)
                 i += len(word) + 1
-        msg += " " * (78 - i) + "|\n" + "+" + "-" * 78 + "+" + "\n"
+        lines.append(words)
+        border = "+" + "-" * 78 + "+"
+        body = "\n".join("|" + f" {' '.join(words)} ".ljust(78) + "|" for words in lines)
+        msg = f"\n{border}\n{body}\n{border}\n"
         super().__init__(msg)
@@ -7,6 +7,10 @@ import json
 import numpy as np
 from .containers import CaseInsensitiveDict, CaseInsensitiveSet
 
+# Number of rows formatted and written at a time by the tecplot writers,
+# which bounds the memory used by the formatted text of large meshes
+TECPLOT_BLOCK_SIZE = 8192
+
 
 def writeJSON(fname, obj, comm=None):
     """
@@ -57,8 +61,10 @@ def writeJSON(fname, obj, comm=None):
                 super().default(o)
 
     if (comm is None) or (comm is not None and comm.rank == 0):
+        # Encode to a string first so the file is written in one call, rather than one call per JSON token
+        jsonString = json.dumps(obj, sort_keys=True, indent=4, separators=(",", ": "), cls=MyEncoder)
         with open(fname, "w") as json_file:
-            json.dump(obj, json_file, sort_keys=True, indent=4, separators=(",", ": "), cls=MyEncoder)
+            json_file.write(jsonString)
     if comm is not None:
         comm.barrier()
 
@@ -5,6 +5,16 @@ import re
 import sys
 from pprint import pformat
 
+# Patterns used by ParseStringFormat, compiled once at import instead of on every parse
+_ALIGN_PATTERN = re.compile("[<>=^]")
+_SIGN_PATTERN = re.compile("[+ -]")
+_NUMBER_PATTERN = re.compile("[0-9]+")
+_GROUPING_PATTERN = re.compile("[_,]")
+_TYPE_PATTERN = re.compile("[bcdeEfFgGnosxX%]")
+
+# The interpreter version does not change at runtime, so check it once at import
+_PY36 = sys.version_info >= (3, 6)
+
 
 def getPy3SafeString(string):
     """Accepts a string and makes sure it's converted to unicode for python 3.6 and above"""
@@ -14,7 +24,7 @@ def getPy3SafeString(string):
 
     # python 3.6 compatibility requires that we force things into a binary string
     #       representation for the dictioanry key because the stuff coming out of f2py is binary-strings
-    if sys.version_info >= (3, 6) and isinstance(string, bytes):
+    if _PY36 and isinstance(string, bytes):
         return string.decode("utf-8")
 
     return string
@@ -72,29 +82,29 @@ class ParseStringFormat(object):
         fmt = fmt[fmt.find("{") + 1 : fmt.find("}")][1:]
 
         # Check for align characters. There can only be one for a valid string.
-        align = re.search("[<>=^]", fmt)
+        align = _ALIGN_PATTERN.search(fmt)
         if align:
             self._align = align[0]
 
         # Check for sign characters. There can only be one for a valid string.
-        sign = re.search("[+ -]", fmt)
+        sign = _SIGN_PATTERN.search(fmt)
         if sign:
             self._sign = sign[0]
 
         # Get width and precision
-        for i, item in enumerate(re.findall("[0-9]+", fmt)):
+        for i, item in enumerate(_NUMBER_PATTERN.findall(fmt)):
             if i == 0:
                 self._width = int(item)
             if i == 1:
                 self._precision = int(item)
 
         # Check for grouping options
-        gOption = re.search("[_,]", fmt)
+        gOption = _GROUPING_PATTERN.search(fmt)
         if gOption:
             self._grouping_option = gOption[0]
 
         # Get the formatting type
-        ftype = re.search("[bcdeEfFgGnosxX%]", fmt)
+        ftype = _TYPE_PATTERN.search(fmt)
         if ftype:
             self._ftype = ftype[0]
 
@@ -96,6 +96,66 @@ class TestAeroProblem(unittest.TestCase):
                 dvName = self.DVs[dv]["name"]
                 self.assertEqual(newDVs[dvName], setDVs[dvName], msg=f"{dv} DV value is incorrect")
 
+    def test_setDVState(self):
+        """Ensure that setDesignVars updates the flow states the same way as setting the attributes directly"""
+        for name, kwargs in [
+            ("mach", {"mach": 0.84, "reynolds": 11.71e6, "reynoldsLength": 0.646, "T": 300.0}),
+            ("altitude", {"mach": 0.78, "altitude": 10000.0}),
+        ]:
+            with self.subTest(f"Testing `setDesignVars` flow states for {name} inputs", name=name):
+                ap = AeroProblem("test", alpha=2.0, areaRef=1.0, chordRef=1.0, **kwargs)
+                apRef = AeroProblem("test", alpha=2.0, areaRef=1.0, chordRef=1.0, **kwargs)
+                x = {}
+                for key, value in kwargs.items():
+                    offset = 0.01 * value
+                    ap.addDV(key, value, name=key.upper(), offset=offset)
+                    x[key.upper()] = 1.1 * value
+                    setattr(apRef, key, 1.1 * value + offset)
+                ap.addDV("alpha", 2.0, name="ALPHA")
+                x["ALPHA"] = 3.0
+                apRef.alpha = 3.0
+
+                ap.setDesignVars(x)
+                for key in kwargs:
+                    self.assertEqual(getattr(ap, key), x[key.upper()] + ap.DVs[key.upper()].offset)
+                self.assertEqual(ap.alpha, 3.0)
+                # The derived states must not be stale
+                for key in ap.fullState:
+                    if getattr(apRef, key) is None:
+                        self.assertIsNone(getattr(ap, key), msg=key)
+                    else:
+                        np.testing.assert_allclose(getattr(ap, key), getattr(apRef, key), rtol=1e-14, err_msg=key)
+
+    def test_evalFunctionsSens(self):
+        self.addDesignVariables()
+        evalFuncs = ["alpha", "mach", "V", "q"]
+        funcsSens = {}
+        dvs = self.ap.getDesignVars()
+        self.ap.evalFunctionsSens(funcsSens, evalFuncs)
+        # Computing the sensitivities must not modify the DV values
+        self.assertEqual(dvs, self.ap.getDesignVars())
+        for func in evalFuncs:
+            funcName = self.ap.funcNames[func]
+            for dv in self.DVs:
+                if "family" in self.DVs[dv]:
+                    continue
+                dvName = self.DVs[dv]["name"]
+                with self.subTest(f"Testing `evalFunctionsSens` for {func} wrt {dv}", func=func, dv=dv):
+                    # Compare against a central finite difference
+                    value = getattr(self.ap, dv)
+                    step = 1e-6 * max(abs(value), 1.0)
+                    setattr(self.ap, dv, value + step)
+                    funcPlus = getattr(self.ap, func)
+                    setattr(self.ap, dv, value - step)
+                    funcMinus = getattr(self.ap, func)
+                    setattr(self.ap, dv, value)
+                    np.testing.assert_allclose(
+                        funcsSens[funcName][dvName], (funcPlus - funcMinus) / (2 * step), rtol=1e-6, atol=1e-8
+                    )
+
+        # Invalid functions raise an error
+        self.assertRaises(baseclassesError, self.ap.evalFunctionsSens, {}, ["nonexistentFunc"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -25,6 +25,12 @@ par_vals = {
     "par val": [0.5, 1.5],
     "par sum": 0.5 + 1.5,
     "par norm": np.sqrt(2.5),
+    "par fused sum": 0.5 + 1.5,
+    "par fused norm": np.sqrt(2.5),
+    "par array val": [np.array([0.0, 0.5]), np.array([1.0, 1.5])],
+    "par int array val": [np.array([0, 1], dtype=np.int32), np.array([2, 3], dtype=np.int32)],
+    "par buffer val": [np.array([0.0, 0.5]), np.array([1.0, 1.5])],
+    "par buffer scalar val": [0.5, 1.5],
 }
 
 
@@ -98,6 +104,13 @@ class TestBaseRegTest(unittest.TestCase):
         handler.par_add_val("par val", val)
         handler.par_add_sum("par sum", val)
         handler.par_add_norm("par norm", val)
+        handler.par_add_sum_and_norm("par fused sum", "par fused norm", val)
+        handler.par_add_val("par array val", np.array([self.rank, self.rank + 0.5]))
+        # arrays can also be gathered as raw buffers, keeping their dtype
+        handler.par_add_val("par int array val", np.arange(2, dtype=np.int32) + 2 * self.rank, use_buffer=True)
+        handler.par_add_val("par buffer val", np.array([self.rank, self.rank + 0.5]), use_buffer=True)
+        # values that cannot be gathered as buffers fall back to pickled objects
+        handler.par_add_val("par buffer scalar val", val, use_buffer=True)
 
     def test_train_then_test_root(self):
         """
@@ -121,6 +134,22 @@ class TestBaseRegTest(unittest.TestCase):
         handler = BaseRegTest(self.ref_file, train=False)
         self.regression_test_root(handler)
 
+    def test_train_then_test_root_pickle(self):
+        """
+        Test that reference files ending in .pkl are written and read back with pickle
+        """
+        self.ref_file = os.path.join(baseDir, "test_root.pkl")
+        with BaseRegTest(self.ref_file, train=True) as handler:
+            self.regression_test_root(handler)
+            handler.root_add_val("array", np.linspace(0.0, 1.0, 11))
+        test_vals = handler.readRef()
+        np.testing.assert_equal(test_vals, {**root_vals, "array": np.linspace(0.0, 1.0, 11)})
+
+        # test train=False
+        handler = BaseRegTest(self.ref_file, train=False)
+        self.regression_test_root(handler)
+        handler.root_add_val("array", np.linspace(0.0, 1.0, 11))
+
     @require_mpi
     def test_train_then_test_par(self):
         """
@@ -131,10 +160,29 @@ class TestBaseRegTest(unittest.TestCase):
         with BaseRegTest(self.ref_file, train=True) as handler:
             self.regression_test_par(handler)
         test_vals = handler.readRef()
-        self.assertEqual(test_vals, par_vals)
+        np.testing.assert_equal(test_vals, par_vals)
+        for val in test_vals["par int array val"]:
+            self.assertEqual(val.dtype, np.int32)
         with BaseRegTest(self.ref_file, train=False) as handler:
             self.regression_test_par(handler)
 
+    @require_mpi
+    def test_par_mixed_dtypes(self):
+        """
+        Test that the parallel reductions are correct when the procs hold values of different types
+        """
+        self.ref_file = os.path.join(baseDir, "test_par_mixed.ref")
+        values = np.array([1, 2, 3]) if self.rank == 0 else np.array([0.5])
+        with BaseRegTest(self.ref_file, train=True) as handler:
+            handler.par_add_sum("par sum", values)
+            handler.par_add_norm("par norm", values)
+            handler.par_add_sum_and_norm("par fused sum", "par fused norm", values)
+        test_vals = handler.readRef()
+        for name in ["par sum", "par fused sum"]:
+            self.assertEqual(test_vals[name], 6.0 + 0.5 * (self.size - 1))
+        for name in ["par norm", "par fused norm"]:
+            self.assertAlmostEqual(test_vals[name], np.sqrt(14.0 + 0.25 * (self.size - 1)), places=14)
+
     @parameterized.expand(
         [
             ("list_of_str", ["A", "B", "C"]),
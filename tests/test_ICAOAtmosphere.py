@@ -0,0 +1,86 @@
+"""
+==============================================================================
+ICAO Atmosphere unit tests
+==============================================================================
+@Description :
+"""
+
+# ==============================================================================
+# Standard Python modules
+# ==============================================================================
+import unittest
+
+# ==============================================================================
+# External Python modules
+# ==============================================================================
+import numpy as np
+
+# ==============================================================================
+# Extension modules
+# ==============================================================================
+from baseclasses.problems import ICAOAtmosphere
+
+# Reference pressure and temperature, covering every layer as well as the smoothing regions around 11 km
+ref_vals = {
+    0.0: (101325.0, 288.15),
+    5000.0: (54048.28588358662, 255.67554322180348),
+    11000.0: (22699.905591850515, 216.8801238092151),
+    11050.0: (22522.26275817757, 216.72775905389162),
+    15000.0: (12111.765715672496, 216.65),
+    25000.0: (2549.178152154892, 221.55206472628424),
+    40000.0: (287.1413265097964, 250.34964610242113),
+    50000.0: (79.77470982916225, 270.65),
+    60000.0: (21.95848934401339, 247.02088477279673),
+    80000.0: (1.0524510617356884, 198.63857625086885),
+}
+
+
+class TestICAOAtmosphere(unittest.TestCase):
+    def setUp(self):
+        self.atm = ICAOAtmosphere()
+
+    def test_scalar(self):
+        for altitude, (P_ref, T_ref) in ref_vals.items():
+            with self.subTest(altitude=altitude):
+                P, T = self.atm(altitude)
+                np.testing.assert_allclose(P, P_ref, rtol=1e-14)
+                np.testing.assert_allclose(T, T_ref, rtol=1e-14)
+
+    def test_englishUnits(self):
+        atm = ICAOAtmosphere(englishUnits=True)
+        P, T = atm(35000.0)
+        np.testing.assert_allclose(P, 499.34841937825865, rtol=1e-14)
+        np.testing.assert_allclose(T, 394.0635160773398, rtol=1e-14)
+
+    def test_array(self):
+        """Evaluating an array of altitudes must match evaluating them one at a time"""
+        altitudes = np.linspace(-500.0, 84000.0, 2001).reshape(3, -1)
+        P, T = self.atm(altitudes)
+        self.assertEqual(P.shape, altitudes.shape)
+        self.assertEqual(T.shape, altitudes.shape)
+        for idx, altitude in np.ndenumerate(altitudes):
+            P_scalar, T_scalar = self.atm(altitude)
+            np.testing.assert_allclose(P[idx], P_scalar, rtol=1e-13)
+            np.testing.assert_allclose(T[idx], T_scalar, rtol=1e-13)
+
+    def test_cache(self):
+        """Repeated scalar evaluations are cached, but complex altitudes must not reuse real results"""
+        P, T = self.atm(11030.0)
+        self.assertEqual(self.atm(11030.0), (P, T))
+        P_cs, T_cs = self.atm(11030.0 + 0j)
+        self.assertIsInstance(P_cs, complex)
+        self.assertEqual(P_cs.real, P)
+
+    def test_complexStep(self):
+        """The complex-step derivative must match a finite difference, including across the smoothing regions"""
+        altitudes = np.array([5000.0, 11030.0, 15000.0, 19980.0, 60000.0])
+        h = 1e-40
+        P, T = self.atm(altitudes + h * 1j)
+        P_fd = (self.atm(altitudes + 1e-3)[0] - self.atm(altitudes - 1e-3)[0]) / 2e-3
+        T_fd = (self.atm(altitudes + 1e-3)[1] - self.atm(altitudes - 1e-3)[1]) / 2e-3
+        np.testing.assert_allclose(np.imag(P) / h, P_fd, rtol=1e-6)
+        np.testing.assert_allclose(np.imag(T) / h, T_fd, rtol=1e-6, atol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()